@@ -9,7 +9,7 @@ import h5py
 
 from hdmf.spec import NamespaceCatalog
 from hdmf.utils import docval, getargs, popargs, call_docval_func, get_docval
-from hdmf.backends.io import HDMFIO
+from hdmf.backends.io import HDMFIO, UnsupportedOperation
 from hdmf.backends.hdf5 import HDF5IO as _HDF5IO
 from hdmf.validate import ValidatorMap
 from hdmf.build import BuildManager, TypeMap
@@ -213,10 +213,24 @@ class NWBHDF5IO(_HDF5IO):
             {'name': 'file', 'type': h5py.File, 'doc': 'a pre-existing h5py.File object', 'default': None},
             {'name': 'comm', 'type': "Intracomm", 'doc': 'the MPI communicator to use for parallel I/O',
              'default': None},
-            {'name': 'driver', 'type': str, 'doc': 'driver for h5py to use when opening HDF5 file', 'default': None})
+            {'name': 'driver', 'type': str, 'doc': 'driver for h5py to use when opening HDF5 file', 'default': None},
+            {'name': 'rdcc_nbytes', 'type': int,
+             'doc': 'size of the raw data chunk cache in bytes (h5py default if None)', 'default': None},
+            {'name': 'rdcc_nslots', 'type': int,
+             'doc': 'number of slots in the raw data chunk cache (h5py default if None)', 'default': None},
+            {'name': 'rdcc_w0', 'type': (int, float),
+             'doc': 'preemption policy of the raw data chunk cache, from 0 to 1 (h5py default if None)',
+             'default': None})
     def __init__(self, **kwargs):
         path, mode, manager, extensions, load_namespaces, file_obj, comm, driver =\
             popargs('path', 'mode', 'manager', 'extensions', 'load_namespaces', 'file', 'comm', 'driver', kwargs)
+        rdcc_nbytes, rdcc_nslots, rdcc_w0 = popargs('rdcc_nbytes', 'rdcc_nslots', 'rdcc_w0', kwargs)
+        chunk_cache = {key: val for key, val in (('rdcc_nbytes', rdcc_nbytes),
+                                                 ('rdcc_nslots', rdcc_nslots),
+                                                 ('rdcc_w0', rdcc_w0)) if val is not None}
+        if chunk_cache and file_obj is not None:
+            raise ValueError("'file' cannot be specified together with 'rdcc_nbytes', 'rdcc_nslots', "
+                             "or 'rdcc_w0'. Set the chunk cache when creating the h5py.File instead")
         if load_namespaces:
             if manager is not None:
                 warn("loading namespaces from file - ignoring 'manager'")
@@ -226,6 +240,8 @@ class NWBHDF5IO(_HDF5IO):
             if 'w' in mode or mode == 'x':
                 raise ValueError("cannot load namespaces from file when writing to it")
 
+            if chunk_cache:
+                file_obj = self.__open_file(path, mode, comm, driver, chunk_cache)
             tm = get_type_map()
             super(NWBHDF5IO, self).load_namespaces(tm, path, file=file_obj, driver=driver)
             manager = BuildManager(tm)
@@ -243,8 +259,27 @@ class NWBHDF5IO(_HDF5IO):
                 manager = get_manager(extensions=extensions)
             elif manager is None:
                 manager = get_manager()
+            if chunk_cache:
+                file_obj = self.__open_file(path, mode, comm, driver, chunk_cache)
         super(NWBHDF5IO, self).__init__(path, manager=manager, mode=mode, file=file_obj, comm=comm, driver=driver)
 
+    @staticmethod
+    def __open_file(path, mode, comm, driver, chunk_cache):
+        '''
+        Open the HDF5 file with the given raw data chunk cache settings. h5py only accepts
+        these settings when a file is opened, so the file cannot be left for HDF5IO to open.
+        The existence checks HDF5IO makes before opening a file are repeated here.
+        '''
+        if not os.path.exists(path) and mode in ('r', 'r+') and driver != 'ros3':
+            msg = "Unable to open file %s in '%s' mode. File does not exist." % (path, mode)
+            raise UnsupportedOperation(msg)
+        if os.path.exists(path) and mode in ('w-', 'x'):
+            msg = "Unable to open file %s in '%s' mode. File already exists." % (path, mode)
+            raise UnsupportedOperation(msg)
+        if comm is not None:
+            return h5py.File(str(path), mode, driver='mpio', comm=comm, **chunk_cache)
+        return h5py.File(str(path), mode, driver=driver, **chunk_cache)
+
     @docval({'name': 'src_io', 'type': HDMFIO, 'doc': 'the HDMFIO object for reading the data to export'},
             {'name': 'nwbfile', 'type': 'NWBFile',
              'doc': 'the NWBFile object to export. If None, then the entire contents of src_io will be exported',
@@ -122,7 +122,7 @@ class TimeSeries(NWBDataInterface):
             {'name': 'control_description', 'type': Iterable, 'doc': 'Description of each control value',
              'default': None},
             {'name': 'continuity', 'type': str, 'default': None, 'enum': ["continuous", "instantaneous", "step"],
-             'doc': 'Optionally describe the continuity of the data. Can be "continuous", "instantaneous", or'
+             'doc': 'Optionally describe the continuity of the data. Can be "continuous", "instantaneous", or '
                     '"step". For example, a voltage trace would be "continuous", because samples are recorded from a '
                     'continuous process. An array of lick times would be "instantaneous", because the data represents '
                     'distinct moments in time. Times of image presentations would be  "step" because the picture '
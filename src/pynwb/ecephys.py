@@ -1,5 +1,7 @@
 from collections.abc import Iterable
 
+import numpy as np
+
 from hdmf.utils import docval, getargs, popargs, call_docval_func, get_docval
 from hdmf.data_utils import DataChunkIterator, assertEqualShape
 
@@ -10,6 +12,16 @@ from hdmf.common import DynamicTableRegion
 from .device import Device
 
 
+def _to_list(data):
+    """
+    Convert 1D data to a list. Array-like data, e.g. HDF5 datasets, is read in a single call
+    rather than element by element.
+    """
+    if hasattr(data, '__array__'):
+        return np.asarray(data).tolist()
+    return list(data)
+
+
 @register_class('ElectrodeGroup', CORE_NAMESPACE)
 class ElectrodeGroup(NWBContainer):
     """
@@ -186,7 +198,7 @@ class Clustering(NWBDataInterface):
                     'clusters curated using Klusters, etc).'},
             {'name': 'num', 'type': ('array_data', 'data'), 'doc': 'Cluster number of each event.', 'shape': (None, )},
             {'name': 'peak_over_rms', 'type': Iterable, 'shape': (None, ),
-             'doc': 'Maximum ratio of waveform peak to RMS on any channel in the cluster'
+             'doc': 'Maximum ratio of waveform peak to RMS on any channel in the cluster '
                     '(provides a basic clustering metric).'},
             {'name': 'times', 'type': ('array_data', 'data'), 'doc': 'Times of clustered events, in seconds.',
              'shape': (None,)},
@@ -199,7 +211,7 @@ class Clustering(NWBDataInterface):
         super(Clustering, self).__init__(**kwargs)
         self.description = description
         self.num = num
-        self.peak_over_rms = list(peak_over_rms)
+        self.peak_over_rms = _to_list(peak_over_rms)
         self.times = times
 
 
@@ -344,5 +356,5 @@ class FeatureExtraction(NWBDataInterface):
         super(FeatureExtraction, self).__init__(**kwargs)
         self.electrodes = electrodes
         self.description = description
-        self.times = list(times)
+        self.times = _to_list(times)
         self.features = features
@@ -1,5 +1,7 @@
 from bisect import bisect_left
 
+import numpy as np
+
 from hdmf.utils import docval, getargs, popargs, call_docval_func, get_docval
 from hdmf.data_utils import DataIO
 
@@ -69,6 +71,9 @@ class TimeIntervals(DynamicTable):
         if ts_starting_time is not None and ts_rate:
             start_idx = int((start_time - ts_starting_time)*ts_rate)
             stop_idx = int((stop_time - ts_starting_time)*ts_rate)
+        elif isinstance(ts_timestamps, np.ndarray) and len(ts_timestamps) > 0:
+            # search for both bounds in a single vectorized call
+            start_idx, stop_idx = np.searchsorted(ts_timestamps, (start_time, stop_time), side='left')
         elif len(ts_timestamps) > 0:
             timestamps = ts_timestamps
             start_idx = bisect_left(timestamps, start_time)
@@ -245,7 +245,7 @@ class NWBFile(MultiContainerInterface):
             {'name': 'protocol', 'type': str,
              'doc': 'Experimental protocol, if applicable. E.g., include IACUC protocol', 'default': None},
             {'name': 'related_publications', 'type': (tuple, list, str),
-             'doc': 'Publication information.'
+             'doc': 'Publication information. '
              'PMID, DOI, URL, etc. If multiple, concatenate together and describe which is which. '
              'such as PMID, DOI, URL, etc', 'default': None},
             {'name': 'slices', 'type': str,
@@ -334,7 +334,7 @@ class NWBFile(MultiContainerInterface):
             self.fields['file_create_date'] = [self.fields['file_create_date']]
         self.fields['file_create_date'] = list(map(_add_missing_timezone, self.fields['file_create_date']))
 
-        fieldnames = [
+        fieldnames = (
             'acquisition',
             'analysis',
             'stimulus',
@@ -370,7 +370,7 @@ class NWBFile(MultiContainerInterface):
             'surgery',
             'virus',
             'stimulus_notes',
-        ]
+        )
         for attr in fieldnames:
             setattr(self, attr, kwargs.get(attr, None))
 
@@ -542,20 +542,21 @@ class NWBFile(MultiContainerInterface):
         if d.get('group_name', None) is None:
             d['group_name'] = d['group'].name
 
-        new_cols = [('rel_x', 'the x coordinate within the electrode group'),
+        new_cols = (('rel_x', 'the x coordinate within the electrode group'),
                     ('rel_y', 'the y coordinate within the electrode group'),
                     ('rel_z', 'the z coordinate within the electrode group'),
-                    ('reference', 'Description of the reference used for this electrode.')]
+                    ('reference', 'Description of the reference used for this electrode.'))
+        electrodes = self.electrodes
         # add column if the arg is supplied and column does not yet exist
         # do not pass arg to add_row if arg is not supplied
         for col_name, col_doc in new_cols:
             if kwargs[col_name] is not None:
-                if col_name not in self.electrodes:
-                    self.electrodes.add_column(col_name, col_doc)
+                if col_name not in electrodes:
+                    electrodes.add_column(col_name, col_doc)
             else:
                 d.pop(col_name)  # remove args from d if not set
 
-        call_docval_func(self.electrodes.add_row, d)
+        call_docval_func(electrodes.add_row, d)
 
     @docval({'name': 'region', 'type': (slice, list, tuple), 'doc': 'the indices of the table'},
             {'name': 'description', 'type': str, 'doc': 'a brief description of what this electrode is'},
@@ -565,11 +566,12 @@ class NWBFile(MultiContainerInterface):
             msg = "no electrodes available. add electrodes before creating a region"
             raise RuntimeError(msg)
         region = getargs('region', kwargs)
+        n_electrodes = len(self.electrodes)
         for idx in region:
-            if idx < 0 or idx >= len(self.electrodes):
+            if idx < 0 or idx >= n_electrodes:
                 raise IndexError('The index ' + str(idx) +
                                  ' is out of range for the ElectrodeTable of length '
-                                 + str(len(self.electrodes)))
+                                 + str(n_electrodes))
         desc = getargs('description', kwargs)
         name = getargs('name', kwargs)
         return DynamicTableRegion(name, region, desc, self.electrodes)
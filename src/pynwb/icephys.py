@@ -1,5 +1,7 @@
 import warnings
 
+import numpy as np
+
 from hdmf.common import DynamicTable
 from hdmf.utils import docval, popargs, call_docval_func, get_docval
 
@@ -316,7 +318,10 @@ class SweepTable(DynamicTable):
         Return the row ids for the given sweep number.
         """
 
-        return [index for index, elem in enumerate(self['sweep_number'].data) if elem == sweep_number]
+        # compare the whole column at once rather than element by element, which is
+        # especially costly when the column is backed by an HDF5 dataset
+        sweep_numbers = np.asarray(self['sweep_number'].data)
+        return np.flatnonzero(sweep_numbers == sweep_number).tolist()
 
 
 def ensure_unit(self, name, current_unit, unit, nwb_version):
@@ -19,7 +19,7 @@ class NWBBaseTypeMapper(ObjectMapper):
         while curr is not None:
             if isinstance(curr, NWBFile):
                 return curr
-            curr = container.parent
+            curr = curr.parent
 
 
 @register_map(NWBContainer)
@@ -78,10 +78,10 @@ class TypeMapLegacy(TypeMap):
                                                                             'rmse',
                                                                             'comments'):
                     return None
-                elif parent_ndt == 'SpatialSeries' and builder.name in ('features'):
+                elif parent_ndt == 'SpatialSeries' and builder.name in ('features',):
                     return None
                 else:
-                    raise RuntimeError(('Unable to determine neurodata_type: attrs["neurodata_type"]: "Custom",'
+                    raise RuntimeError(('Unable to determine neurodata_type: attrs["neurodata_type"]: "Custom", '
                                         'parent.neurodata_type: %s' % parent_ndt))
             else:
                 parent_ndt = self.get_builder_dt(builder.parent)
@@ -425,3 +425,45 @@ class TestNWBHDF5IO(TestCase):
         with NWBHDF5IO(pathlib_path, 'r') as io:
             read_file = io.read()
             self.assertContainerEqual(read_file, self.nwbfile)
+
+    def test_chunk_cache(self):
+        """Opening a NWBHDF5IO with chunk cache settings should apply them to the HDF5 file"""
+
+        with NWBHDF5IO(self.path, 'w', rdcc_nbytes=4 * 1024**2, rdcc_nslots=10007, rdcc_w0=0.5) as io:
+            io.write(self.nwbfile)
+        with NWBHDF5IO(self.path, 'r', rdcc_nbytes=4 * 1024**2, rdcc_nslots=10007, rdcc_w0=0.5) as io:
+            self.assertTupleEqual(io._file.id.get_access_plist().get_cache()[1:], (10007, 4 * 1024**2, 0.5))
+            read_file = io.read()
+            self.assertContainerEqual(read_file, self.nwbfile)
+
+    def test_chunk_cache_int_w0(self):
+        """The chunk preemption policy can be given as an int"""
+
+        with NWBHDF5IO(self.path, 'w', rdcc_w0=1) as io:
+            self.assertEqual(io._file.id.get_access_plist().get_cache()[3], 1.0)
+            io.write(self.nwbfile)
+
+    def test_chunk_cache_missing_file(self):
+        """Opening a missing file for reading with chunk cache settings should raise the usual HDF5IO error"""
+
+        with self.assertRaisesWith(UnsupportedOperation,
+                                   "Unable to open file %s in 'r' mode. File does not exist." % self.path):
+            NWBHDF5IO(self.path, 'r', rdcc_nbytes=4 * 1024**2)
+
+    def test_chunk_cache_clobber(self):
+        """Opening an existing file in 'w-' mode with chunk cache settings should raise the usual HDF5IO error"""
+
+        with NWBHDF5IO(self.path, 'w') as io:
+            io.write(self.nwbfile)
+        with self.assertRaisesWith(UnsupportedOperation,
+                                   "Unable to open file %s in 'w-' mode. File already exists." % self.path):
+            NWBHDF5IO(self.path, 'w-', rdcc_nbytes=4 * 1024**2)
+
+    def test_chunk_cache_with_file(self):
+        """Chunk cache settings cannot be combined with a pre-existing h5py.File"""
+
+        with File(self.path, 'w') as fil:
+            msg = ("'file' cannot be specified together with 'rdcc_nbytes', 'rdcc_nslots', or 'rdcc_w0'. "
+                   "Set the chunk cache when creating the h5py.File instead")
+            with self.assertRaisesWith(ValueError, msg):
+                NWBHDF5IO(self.path, 'a', file=fil, rdcc_nbytes=4 * 1024**2)
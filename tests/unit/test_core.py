@@ -5,6 +5,7 @@ from hdmf.utils import docval, call_docval_func
 
 from pynwb import NWBFile, TimeSeries, available_namespaces
 from pynwb.core import NWBContainer
+from pynwb.io.core import NWBBaseTypeMapper
 from pynwb.testing import TestCase
 
 
@@ -82,3 +83,26 @@ Fields:
 class TestAvailableNamespaces(TestCase):
     def test_available_namespaces(self):
         self.assertEqual(available_namespaces(), ('hdmf-common', 'hdmf-experimental', 'core'))
+
+
+class TestNWBBaseTypeMapper(TestCase):
+
+    def setUp(self):
+        self.nwbfile = NWBFile(session_description='a file to test the NWBBaseTypeMapper',
+                               identifier='TEST123',
+                               session_start_time=datetime(2017, 5, 1, 12, 0, 0, tzinfo=tzlocal()))
+
+    def test_get_nwb_file(self):
+        """Test that get_nwb_file finds the NWBFile from a container nested more than one level deep
+        """
+        module = self.nwbfile.create_processing_module(name='test_module', description='a test module')
+        ts = TimeSeries(name='test_ts', data=[1, 2, 3], unit='unit', timestamps=[0., 1., 2.])
+        module.add(ts)
+        self.assertIs(NWBBaseTypeMapper.get_nwb_file(ts), self.nwbfile)
+        self.assertIs(NWBBaseTypeMapper.get_nwb_file(self.nwbfile), self.nwbfile)
+
+    def test_get_nwb_file_orphan(self):
+        """Test that get_nwb_file returns None for a container that is not in an NWBFile
+        """
+        ts = TimeSeries(name='test_ts', data=[1, 2, 3], unit='unit', timestamps=[0., 1., 2.])
+        self.assertIsNone(NWBBaseTypeMapper.get_nwb_file(ts))
@@ -156,6 +156,14 @@ class ClusteringConstructor(TestCase):
         self.assertEqual(cc.peak_over_rms, peak_over_rms)
         self.assertEqual(cc.times, times)
 
+    def test_init_peak_over_rms_array(self):
+        peak_over_rms = np.array([5.3, 6.3])
+
+        with self.assertWarnsWith(DeprecationWarning, 'use pynwb.misc.Units or NWBFile.units instead'):
+            cc = Clustering('description', [3, 4], peak_over_rms, [1.3, 2.3])
+        self.assertIsInstance(cc.peak_over_rms, list)
+        self.assertEqual(cc.peak_over_rms, [5.3, 6.3])
+
 
 class ClusterWaveformsConstructor(TestCase):
 
@@ -221,6 +229,16 @@ class FeatureExtractionConstructor(TestCase):
         self.assertEqual(fe.times, event_times)
         self.assertEqual(fe.features, features)
 
+    def test_init_times_array(self):
+        event_times = np.array([1.9, 3.5])
+        table = make_electrode_table()
+        region = DynamicTableRegion('electrodes', [0, 2], 'the first and third electrodes', table)
+        description = ['desc1', 'desc2', 'desc3']
+        features = [[[0, 1, 2], [3, 4, 5]], [[6, 7, 8], [9, 10, 11]]]
+        fe = FeatureExtraction(region, description, event_times, features)
+        self.assertIsInstance(fe.times, list)
+        self.assertEqual(fe.times, [1.9, 3.5])
+
     def test_invalid_init_mismatched_event_times(self):
         event_times = []  # Need 1 event time but give 0
         table = make_electrode_table()
@@ -0,0 +1,26 @@
+from hdmf.build import GroupBuilder, DatasetBuilder
+from hdmf.spec import NamespaceCatalog
+
+from pynwb.legacy.map import TypeMapLegacy
+from pynwb.testing import TestCase
+
+
+class TestTypeMapLegacy(TestCase):
+
+    def setUp(self):
+        self.type_map = TypeMapLegacy(NamespaceCatalog())
+
+    def get_custom_dt(self, name):
+        dataset = DatasetBuilder(name, [1.], attributes={'neurodata_type': 'Custom'})
+        GroupBuilder('position', datasets={name: dataset},
+                     attributes={'neurodata_type': 'TimeSeries', 'ancestry': ['TimeSeries', 'SpatialSeries']})
+        return self.type_map.get_builder_dt(dataset)
+
+    def test_spatial_series_features(self):
+        self.assertIsNone(self.get_custom_dt('features'))
+
+    def test_spatial_series_features_substring(self):
+        msg = ('Unable to determine neurodata_type: attrs["neurodata_type"]: "Custom", '
+               'parent.neurodata_type: SpatialSeries')
+        with self.assertRaisesWith(RuntimeError, msg):
+            self.get_custom_dt('feat')